@@ -5,17 +5,29 @@ This script scrapes term dates from the Penrice Academy website and generates
 an iCalendar (.ics) file that can be imported into calendar applications.
 """
 
+from __future__ import annotations
+
+import argparse
+import atexit
 import calendar
 import datetime
 import hashlib
+import html as html_lib
+import json
 import logging
 import os
 import re
+import sys
 import time
-from typing import NamedTuple, Optional
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Sequence, Union
 
-import requests
-from bs4 import BeautifulSoup, Tag
+# requests and bs4 are imported where they are first used so that importing
+# this module (tests, helpers) does not pay for loading them.
+if TYPE_CHECKING:
+    import requests
+    from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 
 # ============================================================================
@@ -29,6 +41,10 @@ CREATE_SCRAPED_EVENTS = True
 # Toggle generation of inferred holiday breaks between term dates.
 CREATE_HOLIDAY_EVENTS = True
 
+# Read section.user-content with plain regexes when its markup is simple enough,
+# skipping BeautifulSoup entirely; anything unusual falls back to the parser.
+FAST_HTML_EXTRACTION = True
+
 # Words that should be Title Cased in event summaries.
 TITLECASE_WORDS = ["term", "holiday", "half", "INSET"]
 
@@ -36,12 +52,16 @@ TITLECASE_WORDS = ["term", "holiday", "half", "INSET"]
 DEFAULT_RETRIES = 3
 DEFAULT_TIMEOUT = 30
 INITIAL_RETRY_DELAY = 1
+HTTP_POOL_SIZE = 4
+USER_AGENT = "PenriceTermDatesScraper/1.0 (calendar automation; +https://www.penriceacademy.org/)"
 
 # iCalendar configuration
 CALENDAR_PREFIX = "Penrice"
 PRODID = "-//Penrice Academy//EN"
 OUTPUT_DIR = "docs"
 OUTPUT_FILENAME = "penrice.ics"
+# ETag / Last-Modified of the last fetched page, for conditional requests
+CACHE_META_FILENAME = f"{OUTPUT_FILENAME}.meta.json"
 SITE_URL = "https://evenwebb.github.io/penrice-calendar-scraper"
 LOG_FILENAME = "log.txt"
 ICAL_LINE_LENGTH = 75
@@ -79,9 +99,12 @@ END_OF_TERM_PHRASES = (
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
-error_handler = logging.FileHandler(os.path.join(OUTPUT_DIR, LOG_FILENAME), mode='a', encoding='utf-8')
-error_handler.setLevel(logging.ERROR)
-logger.addHandler(error_handler)
+# Guard so re-importing the module (e.g. importlib.reload) does not stack a
+# second file handler and write every error to log.txt twice.
+if not any(isinstance(h, logging.FileHandler) for h in logger.handlers):
+    error_handler = logging.FileHandler(os.path.join(OUTPUT_DIR, LOG_FILENAME), mode='a', encoding='utf-8')
+    error_handler.setLevel(logging.ERROR)
+    logger.addHandler(error_handler)
 
 
 # ============================================================================
@@ -98,20 +121,56 @@ class CalendarEvent(NamedTuple):
     suppress_half_term_week_expand: bool = False
 
 
+# C-level sort key for CalendarEvent rows
+_BY_START = attrgetter("start")
+
+# Shared date steps, so hot loops do not construct a timedelta per iteration
+_ONE_DAY = datetime.timedelta(days=1)
+# Monday to Friday of a half term week: first day plus this span
+_HALF_TERM_SPAN = datetime.timedelta(days=HALF_TERM_WEEKDAYS - 1)
+
 
 # ============================================================================
 # Regular Expressions
 # ============================================================================
 
+MONTH_NAMES = [name.lower() for name in calendar.month_name[1:]]
+# Any full month name anywhere in the text
+MONTH_IN_TEXT_RE = re.compile("|".join(MONTH_NAMES), re.IGNORECASE)
+# Lowercase full and abbreviated month names -> month number
+MONTH_LOOKUP: dict[str, int] = {
+    **{name.lower(): i for i, name in enumerate(calendar.month_abbr) if name},
+    **{name.lower(): i for i, name in enumerate(calendar.month_name) if name},
+}
+
+# Month group only accepts real month names (longest first so "September"
+# wins over "Sep"), so the month lookup after a match cannot miss. Possessive
+# quantifiers and the atomic month group stop the engine backtracking into
+# pieces that can never match another way (requires Python 3.11+). The
+# ordinal suffix ("st", "nd", ...) is a bounded letter run, not an alternation.
 DATE_RE = re.compile(
-    r"(?P<day>\d{1,2})(?:st|nd|rd|th)?\s+(?P<month>[A-Za-z]+)\s+(?P<year>\d{4})"
+    r"(?P<day>\d{1,2}+)[a-z]{0,2}+\s++"
+    r"(?P<month>(?>" + "|".join(sorted(MONTH_LOOKUP, key=len, reverse=True)) + r"))"
+    r"\s++(?P<year>\d{4})",
+    re.IGNORECASE,
 )
 # "Tuesday 1st and Wednesday 2nd September 2026: ..." (two days, one month/year)
 DUAL_DAY_SAME_MONTH_RE = re.compile(
     r"(\d{1,2})(?:st|nd|rd|th)?\s+and\s+\w+\s+(\d{1,2})(?:st|nd|rd|th)?\s+"
     r"([A-Za-z]+)\s+(\d{4})"
 )
-MONTH_NAMES = [datetime.date(2000, m, 1).strftime("%B").lower() for m in range(1, 13)]
+# Cheap prefilter: a line without any digit cannot contain a date
+_HAS_DIGIT = re.compile(r"\d").search
+# Leading ordinal day in the text before a date, e.g. "3rd" in "3rd - 5th January"
+LEADING_DAY_RE = re.compile(r"(\d{1,2})(?:st|nd|rd|th)?")
+
+# Boilerplate lines on the page (cookie/privacy notices, "Updated ..." stamps)
+_IS_SKIP_LINE = re.compile(r"privacy|cookies|updated", re.IGNORECASE).match
+
+# Summary clean-up patterns used for every parsed event
+_SUMMARY_LEADING_COLON_RE = re.compile(r"^\s*:\s*")
+_SUMMARY_BEGINS_AT_3PM_RE = re.compile(r"\s*Begins at 3:00\s*pm\.?$", re.IGNORECASE)
+_HALF_TERM_WORDING_RE = re.compile(r"half[- ]term", re.IGNORECASE)
 
 _TITLECASE_PATTERN: Optional[re.Pattern[str]] = (
     re.compile(
@@ -121,16 +180,40 @@ _TITLECASE_PATTERN: Optional[re.Pattern[str]] = (
     if TITLECASE_WORDS
     else None
 )
+# Lowercased configured word -> its Title Case replacement
+_TITLECASE_MAP: dict[str, str] = {w.lower(): w.title() for w in TITLECASE_WORDS}
 
 
 # ============================================================================
 # HTTP Utilities
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """
+    Return the shared HTTP session, creating it on first use.
+
+    Retries (and repeated runs in one process) reuse its pooled keep-alive
+    connection instead of paying a new TCP+TLS handshake.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE),
+    )
+    atexit.register(session.close)
+    return session
+
+
 def fetch_with_retries(
     url: str,
     retries: int = DEFAULT_RETRIES,
-    timeout: int = DEFAULT_TIMEOUT
+    timeout: int = DEFAULT_TIMEOUT,
+    headers: Optional[dict[str, str]] = None,
 ) -> requests.Response:
     """
     Fetch a URL with exponential backoff retry logic.
@@ -139,6 +222,7 @@ def fetch_with_retries(
         url: The URL to fetch
         retries: Maximum number of retry attempts
         timeout: Request timeout in seconds
+        headers: Extra request headers (e.g. conditional-request validators)
 
     Returns:
         Response object from successful request
@@ -146,28 +230,119 @@ def fetch_with_retries(
     Raises:
         requests.RequestException: If all retry attempts fail
     """
+    import requests
+
+    session = _get_session()
     delay = INITIAL_RETRY_DELAY
-    headers = {
-        "User-Agent": "PenriceTermDatesScraper/1.0 (calendar automation; +https://www.penriceacademy.org/)"
-    }
-    with requests.Session() as session:
-        session.headers.update(headers)
-        for attempt in range(retries):
-            try:
-                response = session.get(url, timeout=timeout)
-                response.raise_for_status()
-                return response
-            except requests.RequestException as exc:
-                logger.warning("Attempt %d failed: %s", attempt + 1, exc)
-                if attempt == retries - 1:
-                    raise
-                time.sleep(delay)
-                delay *= 2
+    for attempt in range(retries):
+        try:
+            response = session.get(url, timeout=timeout, headers=headers)
+            response.raise_for_status()
+            return response
+        except requests.RequestException as exc:
+            logger.warning("Attempt %d failed: %s", attempt + 1, exc)
+            if attempt == retries - 1:
+                raise
+            time.sleep(delay)
+            delay *= 2
 
     # This should never be reached, but satisfies type checker
     raise requests.RequestException("Failed to fetch URL after all retries")
 
 
+@lru_cache(maxsize=None)
+def _generator_fingerprint() -> str:
+    """
+    Hash of this script's source.
+
+    The configuration constants live in the same file, so this covers both
+    code fixes and settings such as TITLECASE_WORDS. Stored with the HTTP
+    validators so a changed generator never reuses output made by an older
+    one just because the page itself is unchanged.
+    """
+    with open(__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _load_cache_meta(meta_path: str) -> dict:
+    """
+    Read the saved cache metadata, or {} if it is missing, unreadable, or
+    was written by a different generator (see :func:`_generator_fingerprint`).
+    """
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(meta, dict) or meta.get("generator") != _generator_fingerprint():
+        return {}
+    return meta
+
+
+def conditional_request_headers(meta_path: str) -> dict[str, str]:
+    """
+    Build If-None-Match / If-Modified-Since headers from the saved validators.
+
+    Returns an empty dict when nothing usable has been saved yet, when the
+    generator has changed since, or when the parsed events needed to rebuild
+    the landing page on a 304 are missing.
+    """
+    meta = _load_cache_meta(meta_path)
+    if not isinstance(meta.get("events"), list):
+        return {}
+
+    headers: dict[str, str] = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def load_cached_events(meta_path: str) -> Optional[list[CalendarEvent]]:
+    """Parsed events saved alongside the validators, or None if unavailable."""
+    rows = _load_cache_meta(meta_path).get("events")
+    if not isinstance(rows, list):
+        return None
+    try:
+        return [
+            CalendarEvent(
+                datetime.date.fromisoformat(start),
+                datetime.date.fromisoformat(end),
+                summary,
+                suppress,
+            )
+            for start, end, summary, suppress in rows
+        ]
+    except (TypeError, ValueError):
+        return None
+
+
+def save_cache_validators(
+    meta_path: str,
+    response: requests.Response,
+    events: Sequence[CalendarEvent] = (),
+) -> None:
+    """
+    Persist the response's ETag / Last-Modified for the next conditional fetch.
+
+    The generator fingerprint and the parsed events are saved with them, so a
+    later 304 can still rebuild the landing page without re-parsing.
+    """
+    meta = {
+        "generator": _generator_fingerprint(),
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "events": [
+            [ev.start.isoformat(), ev.end.isoformat(), ev.summary, ev.suppress_half_term_week_expand]
+            for ev in events
+        ],
+    }
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+        f.write("\n")
+
+
 # ============================================================================
 # Date Parsing
 # ============================================================================
@@ -181,13 +356,12 @@ def date_from_parts(
     context: str = "",
 ) -> Optional[datetime.date]:
     """
-    Build a calendar date from day, full month name, and year.
+    Build a calendar date from day, month name (full or abbreviated), and year.
 
     Centralises validation and logging for all structured date construction.
     """
-    try:
-        month = datetime.datetime.strptime(month_str, "%B").month
-    except ValueError:
+    month = MONTH_LOOKUP.get(month_str.lower())
+    if month is None:
         logger.error(
             "Unrecognised month '%s'%s",
             month_str,
@@ -207,6 +381,19 @@ def date_from_parts(
         return None
 
 
+def _date_from_match(
+    match: re.Match[str],
+    context: str = "",
+) -> Optional[datetime.date]:
+    """Build a date from the named groups of a :data:`DATE_RE` match."""
+    return date_from_parts(
+        int(match.group("day")),
+        match.group("month"),
+        int(match.group("year")),
+        context=context or match.string,
+    )
+
+
 def parse_date(text: str) -> Optional[datetime.date]:
     """
     Parse a date from text using the DATE_RE pattern.
@@ -220,11 +407,7 @@ def parse_date(text: str) -> Optional[datetime.date]:
     match = DATE_RE.search(text)
     if not match:
         return None
-
-    day = int(match.group("day"))
-    month_str = match.group("month")
-    year = int(match.group("year"))
-    return date_from_parts(day, month_str, year, context=text)
+    return _date_from_match(match, context=text)
 
 
 # ============================================================================
@@ -241,12 +424,111 @@ def _should_skip_line(line: str) -> bool:
     Returns:
         True if the line should be skipped, False otherwise
     """
-    if not line:
-        return True
+    return not line or _IS_SKIP_LINE(line) is not None
+
+
+_CONTENT_REGION_CLASSES = frozenset({"user-content", "content__region"})
+
+
+def _is_content_region_class(value: Optional[str]) -> bool:
+    """Strainer test for the page's term-dates container classes."""
+    if not value:
+        return False
+    # Called with the raw attribute string during parsing ("a b c")
+    return any(cls in _CONTENT_REGION_CLASSES for cls in value.split())
 
-    lower_line = line.lower()
-    skip_prefixes = ("privacy", "cookies", "updated")
-    return lower_line.startswith(skip_prefixes)
+
+@lru_cache(maxsize=None)
+def _content_strainer() -> SoupStrainer:
+    """
+    Strainer that only builds the containers extract_lines_from_soup looks in.
+
+    The rest of the page (navigation, footer, scripts) is skipped at parse time.
+    """
+    from bs4 import SoupStrainer
+
+    return SoupStrainer(["section", "div"], class_=_is_content_region_class)
+
+
+# Regex fast path for <section class="... user-content ...">. Only trusted when
+# the section holds no nested <section>, every <p> is explicitly closed, and
+# none of the markup below that a tag-stripping regex would misread is present.
+# "user-content" must be a whole class token ("-" is a \b boundary, so
+# "user-content-wide" or "no-user-content" would otherwise match).
+_USER_CONTENT_SECTION_RE = re.compile(
+    r"""<section\b[^>]*\bclass\s*=\s*["'][^"']*(?<![\w-])user-content(?![\w-])[^"']*["'][^>]*>"""
+    r"(.*?)</section\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_NESTED_SECTION_RE = re.compile(r"<section\b", re.IGNORECASE)
+# Comments and raw-text elements, whose contents are not markup. Complete ones
+# before the section are harmless; one still open there means the match is
+# really inside it (e.g. a commented-out old section).
+_RAW_TEXT_BLOCK_RE = re.compile(
+    r"<!--.*?-->|<(script|style|textarea|title|xmp|iframe|noembed|noframes)\b.*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_RAW_TEXT_OPEN_RE = re.compile(
+    r"<!--|<(?:script|style|textarea|title|xmp|iframe|noembed|noframes|plaintext)\b",
+    re.IGNORECASE,
+)
+# Quoted ">" inside an attribute value (would end a tag early for _TAG_RE)
+_QUOTED_GT_RE = re.compile(r"""=\s*(?:"[^"]*>|'[^']*>)""")
+# A "<" that does not start a tag is text to bs4 but a tag opener to _TAG_RE
+_BARE_LT_RE = re.compile(r"<(?!/?[A-Za-z])")
+# Block elements implicitly close an open <p> in lxml, so their text is not
+# part of the paragraph the regex would see.
+_BLOCK_IN_PARAGRAPH_RE = re.compile(
+    r"</?(?:address|article|aside|blockquote|center|dd|details|dialog|dir|div|dl|dt"
+    r"|fieldset|figcaption|figure|footer|form|h[1-6]|header|hgroup|hr|li|main|menu"
+    r"|nav|ol|p|pre|table|tbody|td|tfoot|th|thead|tr|ul)\b",
+    re.IGNORECASE,
+)
+_P_OPEN_RE = re.compile(r"<p\b", re.IGNORECASE)
+_P_CLOSE_RE = re.compile(r"</p\s*>", re.IGNORECASE)
+_PARAGRAPH_RE = re.compile(r"<p\b[^>]*>(.*?)</p\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def _extract_lines_fast(html: str) -> Optional[list[str]]:
+    """
+    Extract term-date lines from section.user-content without BeautifulSoup.
+
+    Mirrors :func:`extract_lines_from_soup` (each text node of each <p> split
+    into lines) on plain paragraph markup. Returns None for anything the regexes
+    could read differently from lxml (comments, raw-text elements, block tags
+    inside a <p>, bare "<", ...), so the caller can fall back to the full parser.
+    """
+    section = _USER_CONTENT_SECTION_RE.search(html)
+    if not section:
+        return None
+    if _RAW_TEXT_OPEN_RE.search(_RAW_TEXT_BLOCK_RE.sub("", html[: section.start()])):
+        return None
+    markup = section.group(0)
+    body = section.group(1)
+    if (
+        _NESTED_SECTION_RE.search(body)
+        or _RAW_TEXT_OPEN_RE.search(markup)
+        or _QUOTED_GT_RE.search(markup)
+        or _BARE_LT_RE.search(body)
+    ):
+        return None
+    if len(_P_OPEN_RE.findall(body)) != len(_P_CLOSE_RE.findall(body)):
+        return None
+
+    lines: list[str] = []
+    for paragraph in _PARAGRAPH_RE.finditer(body):
+        inner = paragraph.group(1)
+        if _BLOCK_IN_PARAGRAPH_RE.search(inner):
+            return None
+        # Tag boundaries separate text nodes, as get_text("\n") would
+        text = html_lib.unescape(_TAG_RE.sub("\n", inner))
+        for line in text.splitlines():
+            line = line.strip()
+            if _should_skip_line(line):
+                continue
+            lines.append(line)
+    return lines
 
 
 def extract_lines_from_soup(soup: BeautifulSoup) -> list[str]:
@@ -255,9 +537,9 @@ def extract_lines_from_soup(soup: BeautifulSoup) -> list[str]:
 
     Used by tests and by :func:`extract_lines_from_html`.
     """
-    content: Optional[Tag] = soup.select_one("section.user-content")
+    content: Optional[Tag] = soup.find("section", class_="user-content")
     if not content:
-        content = soup.select_one("div.content__region")
+        content = soup.find("div", class_="content__region")
 
     lines: list[str] = []
     if not content:
@@ -265,19 +547,40 @@ def extract_lines_from_soup(soup: BeautifulSoup) -> list[str]:
         return lines
 
     for paragraph in content.find_all("p"):
-        text = paragraph.get_text("\n")
-        for line in text.split("\n"):
-            line = line.strip()
-            if _should_skip_line(line):
-                continue
-            lines.append(line)
+        # A single text node can still hold several lines (bare newlines
+        # rather than <br>), so split each one as get_text("\n") used to.
+        for text in paragraph.stripped_strings:
+            for line in text.splitlines():
+                line = line.strip()
+                if _should_skip_line(line):
+                    continue
+                lines.append(line)
 
     return lines
 
 
-def extract_lines_from_html(html: str) -> list[str]:
-    """Parse HTML string and return term-date lines (no network)."""
-    return extract_lines_from_soup(BeautifulSoup(html, "html.parser"))
+def extract_lines_from_html(html: Union[str, bytes]) -> list[str]:
+    """
+    Parse HTML and return term-date lines (no network).
+
+    Pass raw bytes where possible so lxml can detect the document encoding
+    itself instead of relying on the decoded ``response.text``.
+    """
+    if FAST_HTML_EXTRACTION:
+        try:
+            text = html.decode("utf-8") if isinstance(html, bytes) else html
+        except UnicodeDecodeError:
+            text = None  # Not UTF-8: let lxml work out the encoding
+        if text is not None:
+            lines = _extract_lines_fast(text)
+            if lines is not None:
+                return lines
+
+    from bs4 import BeautifulSoup
+
+    return extract_lines_from_soup(
+        BeautifulSoup(html, "lxml", parse_only=_content_strainer())
+    )
 
 
 def extract_lines() -> list[str]:
@@ -291,7 +594,7 @@ def extract_lines() -> list[str]:
         requests.RequestException: If fetching the URL fails
     """
     response = fetch_with_retries(URL)
-    return extract_lines_from_html(response.text)
+    return extract_lines_from_html(response.content)
 
 
 # ============================================================================
@@ -309,15 +612,17 @@ def _clean_event_summary(summary: str) -> str:
         Cleaned summary text
     """
     summary = summary.strip(" -–")
-    summary = re.sub(r"^\s*:\s*", "", summary)
+    summary = _SUMMARY_LEADING_COLON_RE.sub("", summary)
     # Remove trailing "Begins at 3:00pm" text that indicates early finish
-    summary = re.sub(r"\s*Begins at 3:00\s*pm\.?$", "", summary, flags=re.IGNORECASE)
-    return summary
+    summary = _SUMMARY_BEGINS_AT_3PM_RE.sub("", summary)
+    # Summaries repeat across the page ("Term Begins", "INSET Day"); share one
+    # object per distinct text so equal rows also compare by identity.
+    return sys.intern(summary)
 
 
 def _canonical_half_term_wording(summary: str) -> str:
     """Unify hyphenated or spaced 'half term' labels for downstream checks."""
-    return re.sub(r"(?i)half[- ]term", "Half Term", summary)
+    return _HALF_TERM_WORDING_RE.sub("Half Term", summary)
 
 
 # Half term that starts after school the same day — do not expand to Mon–Fri week.
@@ -374,7 +679,7 @@ def _parse_single_date_event(
     Returns:
         List of (start_date, end_date, summary) tuples
     """
-    end_date = parse_date(match.group(0))
+    end_date = _date_from_match(match, context=line)
     if not end_date:
         logger.error("Could not parse date from line: %s", line)
         return []
@@ -386,8 +691,8 @@ def _parse_single_date_event(
     tail = line[match.end():]
     suppress = _suppress_half_term_week_expand_from_tail(tail)
 
-    if "-" in pre and not any(month in left_part.lower() for month in MONTH_NAMES):
-        day_match = re.search(r"(\d{1,2})(?:st|nd|rd|th)?", left_part)
+    if "-" in pre and not MONTH_IN_TEXT_RE.search(left_part):
+        day_match = LEADING_DAY_RE.search(left_part)
         if day_match:
             # Validate that the remainder after the day number looks like a
             # clean day-range separator (e.g. "3rd - 5th January") and not
@@ -397,7 +702,7 @@ def _parse_single_date_event(
                 start_day = int(day_match.group(1))
                 start_date = date_from_parts(
                     start_day,
-                    datetime.date(end_date.year, end_date.month, 1).strftime("%B"),
+                    calendar.month_name[end_date.month],
                     end_date.year,
                     context=line,
                 )
@@ -432,7 +737,7 @@ def _parse_multiple_single_dates(
     events: list[CalendarEvent] = []
 
     for match in matches:
-        date = parse_date(match.group(0))
+        date = _date_from_match(match, context=line)
         if not date:
             logger.error("Could not parse date from line: %s", line)
             return []
@@ -455,8 +760,8 @@ def _parse_date_range_event(
     Returns:
         List of (start_date, end_date, summary) tuples
     """
-    start_date = parse_date(matches[0].group(0))
-    end_date = parse_date(matches[1].group(0))
+    start_date = _date_from_match(matches[0], context=line)
+    end_date = _date_from_match(matches[1], context=line)
 
     if not start_date or not end_date:
         logger.error("Could not parse date range from line: %s", line)
@@ -483,6 +788,9 @@ def parse_event_line(line: str) -> list[CalendarEvent]:
     Returns:
         List of :class:`CalendarEvent` rows parsed from the line.
     """
+    if not _HAS_DIGIT(line):
+        return []
+
     dual = _try_parse_dual_day_same_month(line)
     if dual is not None:
         return dual
@@ -516,6 +824,18 @@ def parse_event_line(line: str) -> list[CalendarEvent]:
 # Half Term Processing
 # ============================================================================
 
+# Seasonal half term label by start month (index 0 unused); None leaves the
+# summary untouched.
+_HALF_TERM_LABEL_BY_MONTH: tuple[Optional[str], ...] = tuple(
+    "Spring Half Term" if m == SPRING_HALF_TERM_MONTH
+    else "Summer Half Term" if m in SUMMER_HALF_TERM_MONTHS
+    else "Autumn Half Term" if m in AUTUMN_HALF_TERM_MONTHS
+    else None
+    for m in range(13)
+)
+_SEASONAL_HALF_TERM_LABELS = frozenset(filter(None, _HALF_TERM_LABEL_BY_MONTH))
+
+
 def _normalize_half_term_summary(
     summary: str,
     start_date: datetime.date
@@ -533,15 +853,12 @@ def _normalize_half_term_summary(
     if "Half Term" not in summary:
         return summary
 
-    month = start_date.month
-    if month == SPRING_HALF_TERM_MONTH:
-        return summary.replace("Half Term", "Spring Half Term")
-    elif month in SUMMER_HALF_TERM_MONTHS:
-        return summary.replace("Half Term", "Summer Half Term")
-    elif month in AUTUMN_HALF_TERM_MONTHS:
-        return summary.replace("Half Term", "Autumn Half Term")
-
-    return summary
+    label = _HALF_TERM_LABEL_BY_MONTH[start_date.month]
+    # Leave summaries that already name a season alone, so the site's own
+    # "Spring Half Term" never becomes "Spring Spring Half Term".
+    if label is None or any(s in summary for s in _SEASONAL_HALF_TERM_LABELS):
+        return summary
+    return summary.replace("Half Term", label, 1)
 
 
 def _expand_half_term_to_week(
@@ -571,14 +888,14 @@ def _expand_half_term_to_week(
         weekday = start_date.weekday()
         if weekday == 0:  # Monday — extend forward to Friday
             week_start = start_date
-            week_end = start_date + datetime.timedelta(days=4)
+            week_end = start_date + _HALF_TERM_SPAN
         elif weekday == 4:  # Friday — extend backward to Monday
-            week_start = start_date - datetime.timedelta(days=4)
+            week_start = start_date - _HALF_TERM_SPAN
             week_end = start_date
         else:
             # Midweek — anchor to the same week Mon-Fri
             week_start = start_date - datetime.timedelta(days=weekday)
-            week_end = week_start + datetime.timedelta(days=4)
+            week_end = week_start + _HALF_TERM_SPAN
         return week_start, week_end
 
     return start_date, end_date
@@ -588,6 +905,11 @@ def _expand_half_term_to_week(
 # iCalendar Generation
 # ============================================================================
 
+def _titlecase_replacement(match: re.Match[str]) -> str:
+    """Replacement callback for ``_TITLECASE_PATTERN`` matches."""
+    return _TITLECASE_MAP[match.group(0).lower()]
+
+
 def _apply_titlecase(summary: str) -> str:
     """
     Apply Title Case to configured words in the summary.
@@ -600,33 +922,74 @@ def _apply_titlecase(summary: str) -> str:
     """
     if _TITLECASE_PATTERN is None:
         return summary
-    return _TITLECASE_PATTERN.sub(lambda m: m.group(0).title(), summary)
+    return _TITLECASE_PATTERN.sub(_titlecase_replacement, summary)
+
+
+# RFC 5545 TEXT escaping, applied in one str.translate pass
+_ICAL_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", ";": r"\;", ",": r"\,", "\n": r"\n"})
+
+
+def _fold_ical_line(line: str) -> str:
+    """
+    Fold a content line to at most ICAL_LINE_LENGTH octets per physical line.
+
+    Continuation lines start with a single space, and multi-byte UTF-8
+    characters are never split across a fold.
+    """
+    encoded = line.encode("utf-8")
+    if len(encoded) <= ICAL_LINE_LENGTH:
+        return line
+
+    chunks: list[str] = []
+    start = 0
+    limit = ICAL_LINE_LENGTH
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Step back off UTF-8 continuation bytes (0b10xxxxxx)
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        chunks.append(encoded[start:end].decode("utf-8"))
+        start = end
+        # Leave room for the leading space on continuation lines
+        limit = ICAL_LINE_LENGTH - 1
+    return (ICAL_NEWLINE + " ").join(chunks)
 
 
 def _escape_and_fold_ical_text(text: str, prefix: str = "") -> str:
     """Escape and fold iCalendar text fields per RFC 5545."""
-    escaped = (
-        text.replace("\\", "\\\\")
-        .replace(";", r"\;")
-        .replace(",", r"\,")
-        .replace("\n", r"\n")
-    )
-    full_line = prefix + escaped
-    if len(full_line) <= ICAL_LINE_LENGTH:
-        return full_line
+    return _fold_ical_line(prefix + text.translate(_ICAL_TEXT_ESCAPES))
+
+
+def _ical_date(d: datetime.date) -> str:
+    """Format a date as an iCalendar DATE value (YYYYMMDD) without strftime."""
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
+
+
+_VEVENT_TEMPLATE = ICAL_NEWLINE.join(
+    [
+        "BEGIN:VEVENT",
+        "UID:{uid}",
+        "DTSTAMP:{dtstamp}",
+        "DTSTART;VALUE=DATE:{dtstart}",
+        "DTEND;VALUE=DATE:{dtend}",
+        "{summary}",
+        "SEQUENCE:0",
+        "END:VEVENT",
+        "",
+    ]
+)
+
 
-    result = [full_line[:ICAL_LINE_LENGTH]]
-    remaining = full_line[ICAL_LINE_LENGTH:]
-    while remaining:
-        result.append(" " + remaining[:ICAL_LINE_LENGTH - 1])
-        remaining = remaining[ICAL_LINE_LENGTH - 1:]
-    return ICAL_NEWLINE.join(result)
+def _ical_utc_timestamp() -> str:
+    """Current UTC time as an iCalendar DATE-TIME value (for DTSTAMP)."""
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
 def make_ics_event(
     start: datetime.date,
     end: datetime.date,
-    summary: str
+    summary: str,
+    dtstamp: Optional[str] = None,
 ) -> str:
     """
     Generate an iCalendar VEVENT string.
@@ -635,38 +998,59 @@ def make_ics_event(
         start: Event start date
         end: Event end date (inclusive)
         summary: Event description
+        dtstamp: DTSTAMP value shared by a whole calendar; defaults to now
 
     Returns:
         Formatted VEVENT string
     """
-    summary = _apply_titlecase(summary)
-
-    # All summaries should clearly indicate the source of the event
-    prefixed_summary = f"{CALENDAR_PREFIX} {summary}".strip()
+    if dtstamp is None:
+        dtstamp = _ical_utc_timestamp()
+    prefixed_summary, summary_line = _summary_fields(summary)
 
     # iCalendar DTEND is exclusive, so add one day
-    dtend = end + datetime.timedelta(days=1)
+    dtend = end + _ONE_DAY
     uid_seed = f"{start.isoformat()}|{end.isoformat()}|{prefixed_summary}"
     uid = f"{hashlib.sha1(uid_seed.encode('utf-8')).hexdigest()}@penrice-calendar"
-    dtstamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    lines = [
-        "BEGIN:VEVENT",
-        f"UID:{uid}",
-        f"DTSTAMP:{dtstamp}",
-        f"DTSTART;VALUE=DATE:{start.strftime('%Y%m%d')}",
-        f"DTEND;VALUE=DATE:{dtend.strftime('%Y%m%d')}",
-        _escape_and_fold_ical_text(prefixed_summary, "SUMMARY:"),
-        "SEQUENCE:0",
-        "END:VEVENT",
-        "",
-    ]
-    return ICAL_NEWLINE.join(lines)
+    return _VEVENT_TEMPLATE.format(
+        uid=uid,
+        dtstamp=dtstamp,
+        dtstart=_ical_date(start),
+        dtend=_ical_date(dtend),
+        summary=summary_line,
+    )
+
+
+@lru_cache(maxsize=256)
+def _summary_fields(summary: str) -> tuple[str, str]:
+    """
+    Prefixed summary and its escaped, folded SUMMARY line.
+
+    Summaries recur every year (terms, half terms, holidays), so this is
+    worth caching where whole VEVENTs, which differ by date, are not.
+    """
+    # All summaries should clearly indicate the source of the event
+    prefixed_summary = f"{CALENDAR_PREFIX} {_apply_titlecase(summary)}".strip()
+    return prefixed_summary, _escape_and_fold_ical_text(prefixed_summary, "SUMMARY:")
 
 
 # ============================================================================
 # Holiday Inference
 # ============================================================================
 
+# Holiday name by start month (index 0 unused), in the same precedence order
+# as the month mappings above. Christmas also depends on the end month, so it
+# is checked separately in guess_holiday_name.
+_HOLIDAY_NAME_BY_MONTH: tuple[str, ...] = tuple(
+    "Spring Half Term" if m == SPRING_HALF_TERM_MONTH
+    else "Easter Holiday" if m in EASTER_MONTHS
+    else "Summer Half Term" if m in SUMMER_HALF_TERM_MONTHS
+    else "Summer Holidays" if m in SUMMER_HOLIDAY_MONTHS
+    else "Autumn Half Term" if m in AUTUMN_HALF_TERM_MONTHS
+    else "Holiday"
+    for m in range(13)
+)
+
+
 def guess_holiday_name(start: datetime.date, end: datetime.date) -> str:
     """
     Infer holiday name based on the month of the break.
@@ -678,24 +1062,10 @@ def guess_holiday_name(start: datetime.date, end: datetime.date) -> str:
     Returns:
         Descriptive name for the holiday period
     """
-    start_month = start.month
-    end_month = end.month
-
     # Cross-year Christmas break: December to January
-    if start_month in CHRISTMAS_MONTHS and end_month in CHRISTMAS_MONTHS:
+    if start.month in CHRISTMAS_MONTHS and end.month in CHRISTMAS_MONTHS:
         return "Christmas Holidays"
-    if start_month == SPRING_HALF_TERM_MONTH:
-        return "Spring Half Term"
-    if start_month in EASTER_MONTHS:
-        return "Easter Holiday"
-    if start_month in SUMMER_HALF_TERM_MONTHS:
-        return "Summer Half Term"
-    if start_month in SUMMER_HOLIDAY_MONTHS:
-        return "Summer Holidays"
-    if start_month in AUTUMN_HALF_TERM_MONTHS:
-        return "Autumn Half Term"
-
-    return "Holiday"
+    return _HOLIDAY_NAME_BY_MONTH[start.month]
 
 
 def _is_term_resume_event(summary: str) -> bool:
@@ -725,39 +1095,33 @@ def infer_holidays(events: list[CalendarEvent]) -> list[CalendarEvent]:
     Returns:
         Inferred holiday rows (same type; ``suppress_half_term_week_expand`` unused)
     """
-    sorted_events = sorted(events, key=lambda e: e.start)
     holidays: list[CalendarEvent] = []
+    # End-of-term dates still waiting for the next term-start event
+    pending_ends: list[datetime.date] = []
 
-    for i, ev in enumerate(sorted_events):
-        if not _is_end_of_term_for_holiday(ev.summary):
-            continue
-
-        # Find the next term-start event (wording differs across published years)
-        next_start: Optional[datetime.date] = None
-        for j in range(i + 1, len(sorted_events)):
-            later = sorted_events[j]
-            if _is_term_resume_event(later.summary):
-                next_start = later.start
-                break
-
-        if next_start:
-            # Holiday starts the day after term ends
-            hol_start = ev.end + datetime.timedelta(days=1)
+    for ev in sorted(events, key=_BY_START):
+        if pending_ends and _is_term_resume_event(ev.summary):
             # Holiday ends the day before term begins
-            hol_end = next_start - datetime.timedelta(days=1)
-
-            if hol_start <= hol_end:
-                name = guess_holiday_name(hol_start, hol_end)
-                holidays.append(CalendarEvent(hol_start, hol_end, name, False))
+            hol_end = ev.start - _ONE_DAY
+            for term_end in pending_ends:
+                # Holiday starts the day after term ends
+                hol_start = term_end + _ONE_DAY
+                if hol_start <= hol_end:
+                    name = guess_holiday_name(hol_start, hol_end)
+                    holidays.append(CalendarEvent(hol_start, hol_end, name, False))
+            pending_ends.clear()
+
+        if _is_end_of_term_for_holiday(ev.summary):
+            pending_ends.append(ev.end)
 
     # Merge adjacent holidays (handles cross-year Christmas breaks)
-    holidays.sort(key=lambda e: e.start)
+    holidays.sort(key=_BY_START)
     merged: list[CalendarEvent] = []
     for h in holidays:
         if merged:
             prev = merged[-1]
             # Adjacent or overlapping: merge into one
-            if h.start <= prev.end + datetime.timedelta(days=1):
+            if h.start <= prev.end + _ONE_DAY:
                 merged[-1] = CalendarEvent(
                     prev.start,
                     max(prev.end, h.end),
@@ -776,25 +1140,26 @@ def infer_inset_days(events: list[CalendarEvent], holidays: list[CalendarEvent])
     INSET days are typically 1-3 weekdays immediately before a term-resume event
     that are not already covered by holidays or other events.
     """
-    all_events = sorted(events + holidays, key=lambda e: e.start)
+    all_events = sorted(events + holidays, key=_BY_START)
     covered_dates: set[datetime.date] = set()
     for ev in all_events:
         d = ev.start
         while d <= ev.end:
             covered_dates.add(d)
-            d += datetime.timedelta(days=1)
+            d += _ONE_DAY
 
     inset_events: list[CalendarEvent] = []
-    for ev in sorted(events, key=lambda e: e.start):
+    for ev in sorted(events, key=_BY_START):
         if not _is_term_resume_event(ev.summary):
             continue
         # Look backwards from term-resume date for uncovered weekdays
         inset_days: list[datetime.date] = []
-        check_date = ev.start - datetime.timedelta(days=1)
-        while check_date >= ev.start - datetime.timedelta(days=INSET_LOOKBACK_DAYS):
+        check_date = ev.start - _ONE_DAY
+        earliest = ev.start - datetime.timedelta(days=INSET_LOOKBACK_DAYS)
+        while check_date >= earliest:
             if check_date.weekday() < 5 and check_date not in covered_dates:
                 inset_days.append(check_date)
-            check_date -= datetime.timedelta(days=1)
+            check_date -= _ONE_DAY
 
         if 1 <= len(inset_days) <= 3:
             inset_days.sort()
@@ -826,6 +1191,8 @@ def process_events(lines: list[str]) -> list[CalendarEvent]:
     events: list[CalendarEvent] = []
 
     for line in lines:
+        if not _HAS_DIGIT(line):
+            continue
         for ev in parse_event_line(line):
             summary = _canonical_half_term_wording(ev.summary)
             start, end = _expand_half_term_to_week(
@@ -840,49 +1207,51 @@ def process_events(lines: list[str]) -> list[CalendarEvent]:
     return events
 
 
-def generate_ical(events: list[CalendarEvent]) -> str:
+def iter_ical(events: list[CalendarEvent]) -> Iterator[str]:
     """
-    Generate iCalendar content from event tuples.
+    Yield iCalendar content from event tuples, one chunk at a time.
 
     Args:
         events: List of event tuples
 
-    Returns:
-        Complete iCalendar file content
+    Yields:
+        The VCALENDAR header, one VEVENT block per event, then the footer
     """
-    event_strings: list[str] = []
+    yield ICAL_NEWLINE.join(
+        [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-TIMEZONE:{CALENDAR_TIMEZONE}",
+            "REFRESH-INTERVAL;VALUE=DURATION:PT12H",
+            "X-PUBLISHED-TTL:PT12H",
+            "",
+        ]
+    )
+
+    # One generation timestamp for every VEVENT in this calendar
+    dtstamp = _ical_utc_timestamp()
 
     if CREATE_SCRAPED_EVENTS:
         for ev in events:
-            event_strings.append(make_ics_event(ev.start, ev.end, ev.summary))
+            yield make_ics_event(ev.start, ev.end, ev.summary, dtstamp)
 
     if CREATE_HOLIDAY_EVENTS:
         holidays = infer_holidays(events)
         for hev in holidays:
-            event_strings.append(make_ics_event(hev.start, hev.end, hev.summary))
+            yield make_ics_event(hev.start, hev.end, hev.summary, dtstamp)
         # INSET day detection (#18): find teacher training days before term starts
         for iev in infer_inset_days(events, holidays):
-            event_strings.append(make_ics_event(iev.start, iev.end, iev.summary))
-
-    ical = (
-        ICAL_NEWLINE.join(
-            [
-                "BEGIN:VCALENDAR",
-                "VERSION:2.0",
-                f"PRODID:{PRODID}",
-                "CALSCALE:GREGORIAN",
-                "METHOD:PUBLISH",
-                f"X-WR-TIMEZONE:{CALENDAR_TIMEZONE}",
-                "REFRESH-INTERVAL;VALUE=DURATION:PT12H",
-                "X-PUBLISHED-TTL:PT12H",
-            ]
-        )
-        + ICAL_NEWLINE
-        + "".join(event_strings)
-        + f"END:VCALENDAR{ICAL_NEWLINE}"
-    )
+            yield make_ics_event(iev.start, iev.end, iev.summary, dtstamp)
+
+    yield f"END:VCALENDAR{ICAL_NEWLINE}"
 
-    return ical
+
+def generate_ical(events: list[CalendarEvent]) -> str:
+    """Return the complete iCalendar file content as one string."""
+    return "".join(iter_ical(events))
 
 
 # ============================================================================
@@ -909,7 +1278,7 @@ def _build_year_overview(events: list) -> str:
         d = ev.start
         while d <= ev.end:
             day_map[d] = (label, etype)
-            d += datetime.timedelta(days=1)
+            d += _ONE_DAY
     # Group by month
     months = defaultdict(list)
     for d, (label, etype) in sorted(day_map.items()):
@@ -918,7 +1287,7 @@ def _build_year_overview(events: list) -> str:
     for (year, month), days in sorted(months.items()):
         mon_name = calendar.month_name[month]
         day_markers = ""
-        for day, etype in sorted(days, key=lambda x: x[0]):
+        for day, etype in sorted(days, key=itemgetter(0)):
             day_markers += f'<span class="ov-day ov-{etype}" title="{mon_name} {day}: {etype}">{day}</span>'
         blocks.append(f'<div class="ov-month"><div class="ov-month-name">{mon_name} {year}</div><div class="ov-days">{day_markers}</div></div>')
     return "\n".join(blocks)
@@ -932,7 +1301,7 @@ def build_index_html(events: list) -> str:
     gcal_url = f"https://calendar.google.com/calendar/render?cid={ics_url.replace('https://', 'webcal://')}"
 
     # Sort events by date
-    sorted_events = sorted(events, key=lambda e: e.start)
+    sorted_events = sorted(events, key=_BY_START)
     today = datetime.date.today()
     upcoming = [e for e in sorted_events if e.end >= today]
     past = [e for e in sorted_events if e.end < today]
@@ -1087,13 +1456,55 @@ def build_index_html(events: list) -> str:
 </html>"""
 
 
-def main() -> None:
+def _write_index_html(events: list[CalendarEvent]) -> None:
+    """Generate the HTML landing page into OUTPUT_DIR."""
+    html = build_index_html(events)
+    html_path = os.path.join(OUTPUT_DIR, "index.html")
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(html)
+    print(f"Created {html_path}")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
     """Main entry point for the calendar scraper.
 
     Fetches term dates, parses events, and generates an iCalendar file and HTML landing page.
+    When the page is unchanged since the last run (HTTP 304) and the generator
+    is the same, the calendar is kept and only the landing page is rebuilt.
     """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="ignore the saved ETag/Last-Modified and always re-download the page",
+    )
+    args = parser.parse_args(argv)
+
+    import requests
+
+    ics_path = os.path.join(OUTPUT_DIR, OUTPUT_FILENAME)
+    meta_path = os.path.join(OUTPUT_DIR, CACHE_META_FILENAME)
+
     try:
-        lines = extract_lines()
+        # Only ask for a 304 when there is an existing calendar to fall back on
+        request_headers: dict[str, str] = {}
+        if not args.force and os.path.exists(ics_path):
+            request_headers = conditional_request_headers(meta_path)
+
+        response = fetch_with_retries(URL, headers=request_headers)
+        if response.status_code == 304:
+            print(f"Term dates page unchanged; keeping {ics_path}.")
+            # The landing page's upcoming/past split depends on today's date,
+            # so rebuild it from the saved events even when nothing changed.
+            cached_events = load_cached_events(meta_path)
+            if cached_events is None:
+                logger.error("Got 304 but no cached events in %s", meta_path)
+                print("Error: Cached events missing; rerun with --force.")
+                return
+            _write_index_html(cached_events)
+            return
+
+        lines = extract_lines_from_html(response.content)
         if not lines:
             logger.error("No lines extracted from website")
             print("Error: No term dates found on website. Check log.txt for details.")
@@ -1105,22 +1516,19 @@ def main() -> None:
             print("Error: No events parsed. Check log.txt for details.")
             return
 
-        ical_content = generate_ical(events)
-
         # Ensure output directory exists
         os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-        ics_path = os.path.join(OUTPUT_DIR, OUTPUT_FILENAME)
-        with open(ics_path, "w", encoding="utf-8") as f:
-            f.write(ical_content)
+        # Binary mode: content already uses CRLF (RFC 5545), and text mode
+        # would translate it to CRCRLF on Windows.
+        with open(ics_path, "wb") as f:
+            f.writelines(chunk.encode("utf-8") for chunk in iter_ical(events))
         print(f"Created {ics_path} with term dates events.")
 
-        # Generate HTML landing page
-        html = build_index_html(events)
-        html_path = os.path.join(OUTPUT_DIR, "index.html")
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(html)
-        print(f"Created {html_path}")
+        _write_index_html(events)
+
+        # Saved last, so a failed run never leaves validators for output it did not write
+        save_cache_validators(meta_path, response, events)
 
     except requests.RequestException as e:
         logger.error("Failed to fetch term dates: %s", e)
@@ -4,7 +4,15 @@ import datetime
 import re
 from pathlib import Path
 
-from generate_ics import extract_lines_from_html, make_ics_event
+import pytest
+
+import generate_ics
+from generate_ics import (
+    _escape_and_fold_ical_text,
+    _ical_date,
+    extract_lines_from_html,
+    make_ics_event,
+)
 
 FIXTURE = Path(__file__).resolve().parent / "fixtures" / "term_dates_snippet.html"
 
@@ -17,6 +25,107 @@ def test_extract_lines_from_html_finds_content_region() -> None:
     assert any("Half Term Begins at 3:00pm" in ln for ln in lines)
 
 
+def test_extract_lines_ignores_text_outside_content_section() -> None:
+    html = (
+        b"<html><body><nav><p>Monday 5th January 2026 - Nav link</p></nav>"
+        b'<section class="page user-content"><p>Monday 5th January 2026 - Term Begins</p>'
+        b"<p>Privacy notice</p></section></body></html>"
+    )
+    assert extract_lines_from_html(html) == ["Monday 5th January 2026 - Term Begins"]
+
+
+_FAST_PATH_CASES = {
+    "simple": (
+        '<html><body><section class="page user-content">'
+        "<p>Monday 5th January 2026 - Term Begins<br>"
+        "Tuesday 1st &amp; Wednesday 2nd September 2026: Staff INSET&nbsp;Days</p>"
+        '<p class="x"><strong>Friday 17th July 2026</strong> &ndash; End of Term</p>'
+        "<p>Privacy notice</p><h2>Not a paragraph</h2></section></body></html>"
+    ),
+    "class-token-prefix": (
+        '<section class="user-content-wide"><p>Wrong 1st January 2026</p></section>'
+        '<section class="user-content"><p>Right 2nd January 2026</p></section>'
+    ),
+    "class-token-suffix": (
+        '<section class="no-user-content"><p>Wrong 1st January 2026</p></section>'
+        '<section class="user-content"><p>Right 2nd January 2026</p></section>'
+    ),
+    "quoted-gt-attribute": (
+        '<section class="user-content"><p title="a>b">Text 5th January 2026</p></section>'
+    ),
+    "script-in-paragraph": (
+        '<section class="user-content"><p>Term 5th January 2026'
+        "<script>var x = 1;</script></p></section>"
+    ),
+    "style-in-paragraph": (
+        '<section class="user-content"><p><style>p { color: red }</style>'
+        "Term 5th January 2026</p></section>"
+    ),
+    "comment-in-paragraph": (
+        '<section class="user-content"><p>Term<!-- 1st May 2026 --> 5th January 2026</p></section>'
+    ),
+    "commented-out-section": (
+        '<!-- <section class="user-content"><p>Old 1st January 2020</p></section> -->'
+        '<section class="user-content"><p>Term 5th January 2026</p></section>'
+    ),
+    "list-in-paragraph": (
+        '<section class="user-content"><p>Intro<ul><li>Term 5th January 2026</li></ul></p></section>'
+    ),
+    "div-in-paragraph": (
+        '<section class="user-content"><p>Intro<div>Term 5th January 2026</div></p></section>'
+    ),
+    "table-in-paragraph": (
+        '<section class="user-content"><p>Intro<table><tr><td>Term 5th January 2026</td></tr>'
+        "</table></p></section>"
+    ),
+    "bare-less-than": (
+        '<section class="user-content"><p>Years 7 < 9 start<br>Term 5th January 2026</p></section>'
+    ),
+    "textarea-in-paragraph": (
+        '<section class="user-content"><p>Term 5th January 2026'
+        "<textarea><b>1st May 2026</b></textarea></p></section>"
+    ),
+    "head-script-before-section": (
+        '<html><head><script>var s = "<p>1st May 2026</p>";</script><!-- nav --></head>'
+        '<body><section class="user-content"><p>Term 5th January 2026</p></section></body></html>'
+    ),
+}
+
+
+@pytest.mark.parametrize("case", sorted(_FAST_PATH_CASES))
+def test_fast_extraction_matches_parser(case: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    html = _FAST_PATH_CASES[case].encode("utf-8")
+    fast = extract_lines_from_html(html)
+    monkeypatch.setattr(generate_ics, "FAST_HTML_EXTRACTION", False)
+    assert fast == extract_lines_from_html(html)
+
+
+def test_fast_extraction_handles_simple_markup_itself() -> None:
+    html = _FAST_PATH_CASES["simple"]
+    lines = generate_ics._extract_lines_fast(html)
+    assert lines is not None
+    assert "Tuesday 1st & Wednesday 2nd September 2026: Staff INSET\xa0Days" in lines
+    right = generate_ics._extract_lines_fast(_FAST_PATH_CASES["class-token-prefix"])
+    assert right == ["Right 2nd January 2026"]
+    # Complete scripts/comments before the section do not disable the fast path
+    head = generate_ics._extract_lines_fast(_FAST_PATH_CASES["head-script-before-section"])
+    assert head == ["Term 5th January 2026"]
+
+
+@pytest.mark.parametrize(
+    "case",
+    ["quoted-gt-attribute", "script-in-paragraph", "style-in-paragraph", "comment-in-paragraph"],
+)
+def test_fast_extraction_declines_unsafe_markup(case: str) -> None:
+    assert generate_ics._extract_lines_fast(_FAST_PATH_CASES[case]) is None
+
+
+def test_fast_extraction_declines_unclosed_paragraphs() -> None:
+    html = '<section class="user-content"><p>one<p>two</section>'
+    assert generate_ics._extract_lines_fast(html) is None
+    assert extract_lines_from_html(html) == ["one", "two"]
+
+
 def test_make_ics_event_shape() -> None:
     block = make_ics_event(
         datetime.date(2026, 1, 5),
@@ -27,3 +136,23 @@ def test_make_ics_event_shape() -> None:
     assert "DTSTART;VALUE=DATE:20260105" in block
     assert "DTEND;VALUE=DATE:20260106" in block
     assert re.search(r"SUMMARY:Penrice.*Term", block)
+
+
+def test_ical_date_matches_strftime() -> None:
+    d = datetime.date(1999, 12, 25)
+    while d <= datetime.date(2031, 1, 5):
+        assert _ical_date(d) == d.strftime("%Y%m%d")
+        d += datetime.timedelta(days=17)
+    assert _ical_date(datetime.date(5, 1, 2)) == "00050102"
+
+
+def test_summary_escaped_and_folded_by_octets() -> None:
+    assert _escape_and_fold_ical_text("a,b;c\\d", "SUMMARY:") == r"SUMMARY:a\,b\;c\\d"
+
+    text = "Fête de l’école " * 8
+    folded = _escape_and_fold_ical_text(text, "SUMMARY:")
+    physical = folded.split("\r\n")
+    assert len(physical) > 1
+    assert all(len(line.encode("utf-8")) <= 75 for line in physical)
+    assert all(line.startswith(" ") for line in physical[1:])
+    assert physical[0] + "".join(line[1:] for line in physical[1:]) == "SUMMARY:" + text
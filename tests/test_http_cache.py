@@ -0,0 +1,83 @@
+"""Tests for conditional-request validator persistence (no network)."""
+
+import re
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import generate_ics
+from generate_ics import conditional_request_headers, save_cache_validators
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "term_dates_snippet.html"
+
+
+def _without_timestamp(page: str) -> str:
+    """Drop the "Updated <time>" footer so pages from separate runs compare equal."""
+    return re.sub(r"Updated [^<]*", "", page)
+
+
+def test_validators_round_trip(tmp_path: Path) -> None:
+    meta = tmp_path / "penrice.ics.meta.json"
+    response = SimpleNamespace(
+        headers={"ETag": '"abc123"', "Last-Modified": "Wed, 14 Oct 2026 10:00:00 GMT"}
+    )
+    save_cache_validators(str(meta), response)
+    assert conditional_request_headers(str(meta)) == {
+        "If-None-Match": '"abc123"',
+        "If-Modified-Since": "Wed, 14 Oct 2026 10:00:00 GMT",
+    }
+
+
+def test_missing_or_partial_validators(tmp_path: Path) -> None:
+    meta = tmp_path / "penrice.ics.meta.json"
+    assert conditional_request_headers(str(meta)) == {}
+
+    save_cache_validators(str(meta), SimpleNamespace(headers={"ETag": 'W/"v2"'}))
+    assert conditional_request_headers(str(meta)) == {"If-None-Match": 'W/"v2"'}
+
+    meta.write_text("not json", encoding="utf-8")
+    assert conditional_request_headers(str(meta)) == {}
+
+
+def test_validators_ignored_after_generator_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    meta = tmp_path / "penrice.ics.meta.json"
+    save_cache_validators(str(meta), SimpleNamespace(headers={"ETag": '"abc123"'}))
+    monkeypatch.setattr(generate_ics, "_generator_fingerprint", lambda: "different")
+    assert conditional_request_headers(str(meta)) == {}
+
+
+def test_main_keeps_calendar_on_304_and_force_skips_validators(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sent: list[dict[str, str]] = []
+    page = FIXTURE.read_bytes()
+
+    def fake_fetch(url: str, headers: dict[str, str]) -> SimpleNamespace:
+        sent.append(dict(headers))
+        status = 304 if headers.get("If-None-Match") == '"v1"' else 200
+        return SimpleNamespace(status_code=status, content=page, headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(generate_ics, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(generate_ics, "fetch_with_retries", fake_fetch)
+    ics = tmp_path / generate_ics.OUTPUT_FILENAME
+    index = tmp_path / "index.html"
+
+    generate_ics.main([])
+    assert sent[-1] == {}
+    calendar = ics.read_bytes()
+    landing = index.read_text(encoding="utf-8")
+
+    ics.write_bytes(calendar + b"; untouched")
+    index.write_text("stale", encoding="utf-8")
+    generate_ics.main([])
+    assert sent[-1] == {"If-None-Match": '"v1"'}
+    assert ics.read_bytes() == calendar + b"; untouched"
+    rebuilt = index.read_text(encoding="utf-8")
+    assert _without_timestamp(rebuilt) == _without_timestamp(landing)
+
+    generate_ics.main(["--force"])
+    assert sent[-1] == {}
+    assert ics.read_bytes() == calendar
@@ -19,6 +19,11 @@ def test_date_from_parts_valid() -> None:
     assert d == datetime.date(2026, 1, 5)
 
 
+def test_date_from_parts_month_case_and_abbreviation() -> None:
+    assert date_from_parts(5, "JANUARY", 2026) == datetime.date(2026, 1, 5)
+    assert date_from_parts(5, "Sep", 2026) == datetime.date(2026, 9, 5)
+
+
 def test_date_from_parts_invalid_month() -> None:
     assert date_from_parts(5, "Januarv", 2026) is None
 
@@ -27,6 +32,13 @@ def test_parse_date_delegates_to_parts() -> None:
     assert parse_date("5th January 2026 - Term") == datetime.date(2026, 1, 5)
 
 
+def test_date_re_requires_real_month_name(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level("ERROR"):
+        assert parse_date("Year 7 and 12 pupils 2026 intake") is None
+    assert caplog.text == ""
+    assert parse_date("21ST SEPTEMBER 2026") == datetime.date(2026, 9, 21)
+
+
 def test_dual_day_inset_range() -> None:
     line = (
         "Tuesday 1st and Wednesday 2nd September 2026: "
@@ -89,6 +101,25 @@ def test_half_term_afternoon_suppresses_week_expand() -> None:
     assert out[0].end == datetime.date(2025, 10, 16)
 
 
+def test_half_term_season_added_once() -> None:
+    out = process_events([
+        "Monday 16th February 2026 to Friday 20th February 2026 - Half Term",
+        "Monday 26th October 2026 to Friday 30th October 2026 - Autumn Half Term",
+    ])
+    assert [ev.summary for ev in out] == ["Spring Half Term", "Autumn Half Term"]
+
+
+def test_process_events_ignores_date_split_across_lines() -> None:
+    out = process_events([
+        "Term ends on Friday 5th",
+        "January 2026 is when we return",
+        "Monday 5th January 2026 - Term Begins",
+    ])
+    assert [(ev.start, ev.summary) for ev in out] == [
+        (datetime.date(2026, 1, 5), "Term Begins"),
+    ]
+
+
 @pytest.mark.parametrize("phrase", TERM_RESUME_PHRASES)
 def test_term_resume_phrases(phrase: str) -> None:
     assert _is_term_resume_event(f"Penrice {phrase.title()} for everyone")